@@ -14,6 +14,7 @@ from qiskit.circuit import ParameterExpression
 from qiskit.circuit.classicalregister import Clbit as QiskitClbit
 from qiskit.circuit.quantumregister import Qubit as QiskitQubit
 
+from ..utils import _xreplace_symbols
 from ._gateset import ALL_GATES
 from ._qubit import Qubit
 
@@ -108,7 +109,9 @@ class Gate(object):
 
         for i in range(len(evaluated_gate.params)):
             if isinstance(evaluated_gate.params[i], sympy.Basic):
-                number = evaluated_gate.params[i].subs(symbols_map).evalf()
+                number = _xreplace_symbols(
+                    evaluated_gate.params[i], symbols_map
+                ).evalf()
                 if isinstance(number, sympy.Number):
                     number = float(number)
                 evaluated_gate.params[i] = number
@@ -1,26 +1,29 @@
 import json
-import random
-from random import uniform
 from typing import Optional, cast, Dict
 
 import networkx as nx
+import numpy as np
 from zquantum.core.typing import AnyPath, LoadSource
 
 from .utils import SCHEMA_VERSION
 
 
-def save_graph(graph: nx.Graph, filename: AnyPath):
+def save_graph(graph: nx.Graph, filename: AnyPath, pretty: bool = False):
     """Saves a NetworkX graph object to JSON file.
 
     Args:
         graph (networks.Graph): the input graph object
         filename (string): name of the output file
+        pretty (bool): if True, the output is indented for readability. Otherwise
+            it is written compactly, which is considerably faster for large graphs.
     """
-    f = open(filename, "w")
     graph_dict = nx.readwrite.json_graph.node_link_data(graph)
     graph_dict["schema"] = SCHEMA_VERSION + "-graph"
-    json.dump(graph_dict, f, indent=2)
-    f.close()
+    with open(filename, "w") as f:
+        if pretty:
+            json.dump(graph_dict, f, indent=2)
+        else:
+            json.dump(graph_dict, f, separators=(",", ":"))
 
 
 def load_graph(file: LoadSource) -> nx.Graph:
@@ -46,14 +49,9 @@ def compare_graphs(graph1: nx.Graph, graph2: nx.Graph) -> bool:
     """Compares two NetworkX graph objects to see if they are identical.
     NOTE: this is *not* solving isomorphism problem.
     """
-
-    for n1, n2 in zip(graph1.nodes, graph2.nodes):
-        if n1 != n2:
-            return False
-    for e1, e2 in zip(graph1.edges, graph2.edges):
-        if e1 != e2:
-            return False
-    return True
+    return list(graph1.nodes) == list(graph2.nodes) and list(graph1.edges) == list(
+        graph2.edges
+    )
 
 
 def generate_graph_node_dict(graph: nx.Graph) -> dict:
@@ -66,11 +64,7 @@ def generate_graph_node_dict(graph: nx.Graph) -> dict:
     Returns:
         A dictionary as described
     """
-    nodes_int_map = []
-    for node_index, node in enumerate(graph.nodes):
-        nodes_int_map.append((node, node_index))
-    nodes_dict = dict(nodes_int_map)
-    return nodes_dict
+    return {node: node_index for node_index, node in enumerate(graph.nodes)}
 
 
 def generate_random_graph_erdos_renyi(
@@ -173,14 +167,14 @@ def weight_graph_edges(
     """
     assert not graph.is_multigraph(), "Cannot deal with multigraphs"
 
-    random.seed(seed)
     if random_weights:
-        weighted_edges = [(e[0], e[1], uniform(0, 1)) for e in graph.edges]
+        edges = list(graph.edges)
+        # Drawing all weights in one call is much faster than sampling per edge.
+        weights = np.random.default_rng(seed).random(len(edges))
+        nx.set_edge_attributes(graph, dict(zip(edges, weights.tolist())), "weight")
     else:
-        weighted_edges = [(e[0], e[1], 1.0) for e in graph.edges]
+        nx.set_edge_attributes(graph, 1.0, "weight")
 
-    # If edges already present, it will effectively update them (except for multigraph)
-    graph.add_weighted_edges_from(weighted_edges)
     return graph
 
 
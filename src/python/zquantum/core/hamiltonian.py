@@ -1,6 +1,5 @@
 from typing import Callable, Dict, List, Optional, Tuple
 import numpy as np
-import copy
 from openfermion.ops import InteractionOperator, InteractionRDM, QubitOperator
 
 from .measurement import ExpectationValues, expectation_values_to_real
@@ -122,7 +121,9 @@ def _calculate_variance_upper_bound(group: QubitOperator) -> float:
 
 
 def _remove_constant_term_from_group(group: QubitOperator) -> QubitOperator:
-    new_group = copy.deepcopy(group)
+    # Terms and coefficients are immutable, so copying the terms dict is enough.
+    new_group = type(group)()
+    new_group.terms = dict(group.terms)
     if new_group.terms.get(()):
         del new_group.terms[()]
     return new_group
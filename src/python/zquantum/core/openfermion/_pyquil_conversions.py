@@ -17,8 +17,9 @@
 """
 Translates OpenFermion Objects to pyQuil objects
 """
-from typing import Union
+from typing import Any, Dict, Tuple, Union
 
+from openfermion.config import EQ_TOLERANCE
 from openfermion.ops import QubitOperator
 from pyquil.paulis import PauliSum, PauliTerm
 
@@ -36,12 +37,15 @@ def qubitop_to_pyquilpauli(qubit_operator: QubitOperator) -> PauliSum:
     if not isinstance(qubit_operator, QubitOperator):
         raise TypeError("qubit_operator must be a OpenFermion " "QubitOperator object")
 
-    terms = []
-    for qubit_terms, coefficient in qubit_operator.terms.items():
-        base_term: Union[PauliTerm, PauliSum] = PauliTerm("I", 0)
-        for tensor_term in qubit_terms:
-            base_term *= PauliTerm(tensor_term[1], tensor_term[0])
-        terms.append(base_term * coefficient)
+    # QubitOperator terms act on distinct qubits, so each PauliTerm can be built
+    # directly instead of multiplying single-qubit terms one by one.
+    terms = [
+        PauliTerm.from_list(
+            [(operator, qubit) for qubit, operator in qubit_terms],
+            coefficient=coefficient,
+        )
+        for qubit_terms, coefficient in qubit_operator.terms.items()
+    ]
 
     paulisum = PauliSum(terms)
 
@@ -66,12 +70,19 @@ def pyquilpauli_to_qubitop(pyquil_pauli: Union[PauliTerm, PauliSum]) -> QubitOpe
     if isinstance(pyquil_pauli, PauliTerm):
         pyquil_pauli = PauliSum([pyquil_pauli])
 
-    transformed_term = QubitOperator()
-    # iterate through the PauliTerms of PauliSum
+    # Accumulate coefficients in a plain dict and build the operator once, instead
+    # of creating and adding a QubitOperator per PauliTerm.
+    terms: Dict[Tuple[Tuple[Any, str], ...], Any] = {}
     for pauli_term in pyquil_pauli.terms:
-        transformed_term += QubitOperator(
-            term=tuple(zip(pauli_term._ops.keys(), pauli_term._ops.values())),
-            coefficient=pauli_term.coefficient,
-        )
+        # PauliTerm acts on each qubit at most once, so sorting by qubit index
+        # gives the canonical QubitOperator term.
+        term = tuple(sorted(pauli_term._ops.items()))
+        terms[term] = terms.get(term, 0.0) + pauli_term.coefficient
 
+    transformed_term = QubitOperator()
+    transformed_term.terms = {
+        term: coefficient
+        for term, coefficient in terms.items()
+        if abs(coefficient) >= EQ_TOLERANCE
+    }
     return transformed_term
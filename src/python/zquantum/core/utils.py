@@ -522,6 +522,23 @@ def create_symbols_map(
     return [(symbol, param) for symbol, param in zip(symbols, params.tolist())]
 
 
+def _xreplace_symbols(expression: sympy.Basic, symbols_map) -> sympy.Basic:
+    """Substitute values for symbols in a sympy expression or matrix.
+
+    Symbols maps are keyed by plain symbols, so a structural `xreplace` is enough.
+    It is much cheaper than `subs`, which runs pattern matching for every
+    subexpression. Values are sympified, because `xreplace` expects sympy objects.
+
+    Args:
+        expression: sympy expression or matrix.
+        symbols_map: dict or iterable of (symbol, value) pairs, e.g. as returned by
+            `create_symbols_map`.
+    """
+    return expression.xreplace(
+        {symbol: sympy.sympify(value) for symbol, value in dict(symbols_map).items()}
+    )
+
+
 def save_timing(walltime: float, filename: AnyPath) -> None:
     """
     Saves timing information.
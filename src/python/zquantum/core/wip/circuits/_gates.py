@@ -3,13 +3,18 @@ import math
 from dataclasses import dataclass, replace
 from functools import singledispatch
 from numbers import Number
-from typing import Callable, Dict, Tuple, Union, Iterable
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
 
 import numpy as np
 import sympy
 from typing_extensions import Protocol, runtime_checkable
 
-from ._unitary_tools import _lift_matrix_numpy, _lift_matrix_sympy
+from ...utils import _xreplace_symbols
+from ._unitary_tools import (
+    _apply_matrix_numpy,
+    _lift_matrix_numpy,
+    _lift_matrix_sympy,
+)
 
 Parameter = Union[sympy.Symbol, Number]
 
@@ -148,7 +153,36 @@ class GateOperation:
         return (
             _lift_matrix_sympy(self.gate.matrix, self.qubit_indices, num_qubits)
             if self.gate.free_symbols
-            else _lift_matrix_numpy(self.gate.matrix, self.qubit_indices, num_qubits)
+            else _lift_matrix_numpy(
+                _numeric_gate_matrix(self.gate), self.qubit_indices, num_qubits
+            )
+        )
+
+    def apply(self, wavefunction: Sequence[Parameter]) -> Sequence[Parameter]:
+        """Apply this operation to a wavefunction.
+
+        This is equivalent to, but much cheaper than, multiplying the wavefunction by
+        `self.lifted_matrix(num_qubits)`.
+        """
+        num_qubits = len(wavefunction).bit_length() - 1
+        if (
+            len(wavefunction) != 2 ** num_qubits
+            or any(not 0 <= index < num_qubits for index in self.qubit_indices)
+            or len(set(self.qubit_indices)) != len(self.qubit_indices)
+        ):
+            raise ValueError(
+                f"Operation acting on qubits {self.qubit_indices} cannot be applied to "
+                f"wavefunction of length {len(wavefunction)}."
+            )
+
+        if self.gate.free_symbols:
+            raise RuntimeError(
+                "GateOperation can be applied only if all symbolic parameters are "
+                "bound to numbers."
+            )
+
+        return _apply_matrix_numpy(
+            _numeric_gate_matrix(self.gate), self.qubit_indices, wavefunction
         )
 
     def __str__(self):
@@ -171,7 +205,7 @@ def _sub_symbols_in_number(
 def _sub_symbols_in_expression(
     parameter: sympy.Expr, symbols_map: Dict[sympy.Symbol, Parameter]
 ) -> sympy.Expr:
-    return parameter.subs(symbols_map)
+    return _xreplace_symbols(parameter, symbols_map)
 
 
 @_sub_symbols.register
@@ -181,6 +215,40 @@ def _sub_symbols_in_symbol(
     return symbols_map.get(parameter, parameter)
 
 
+def _cached_attr(obj, attr_name: str, compute: Callable[[], Any]):
+    """Get value of `attr_name` on a frozen dataclass, computing it on first access.
+
+    Lazily computed values are stored outside of dataclass fields, so they don't take
+    part in comparisons, hashing or `dataclasses.replace`.
+    """
+    try:
+        return obj.__dict__[attr_name]
+    except KeyError:
+        value = compute()
+        object.__setattr__(obj, attr_name, value)
+        return value
+
+
+def _numeric_gate_matrix(gate: Gate) -> np.ndarray:
+    """Complex numpy array equal to the matrix of a gate without free symbols.
+
+    Gate matrices are sympy matrices, and converting them elementwise is costly. For
+    `MatrixFactoryGate`s, which all built-in gates are, the conversion is done once per
+    gate instance and the (read-only) result is reused.
+    """
+    if isinstance(gate, MatrixFactoryGate):
+        return _cached_attr(
+            gate, "_numeric_matrix", lambda: _read_only_complex_array(gate.matrix)
+        )
+    return np.array(gate.matrix, dtype=complex)
+
+
+def _read_only_complex_array(matrix: sympy.Matrix) -> np.ndarray:
+    array = np.array(matrix, dtype=complex)
+    array.setflags(write=False)
+    return array
+
+
 def _all_attrs_equal(obj, other_obj, attrs):
     return all(getattr(obj, attr) == getattr(other_obj, attr) for attr in attrs)
 
@@ -224,9 +292,15 @@ class MatrixFactoryGate:
         """Unitary matrix defining action of this gate.
 
         This is a computed property using `self.matrix_factory` called with parameters
-            bound to this gate.
+            bound to this gate. Gates are immutable, so the matrix is constructed at
+            most once per gate instance. The matrix is shared by all callers, hence it
+            is immutable too.
         """
-        return self.matrix_factory(*self.params)
+        return _cached_attr(
+            self,
+            "_matrix",
+            lambda: sympy.ImmutableMatrix(self.matrix_factory(*self.params)),
+        )
 
     def bind(self, symbols_map) -> "MatrixFactoryGate":
         return self.replace_params(
@@ -251,6 +325,9 @@ class MatrixFactoryGate:
         )
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if type(self) != type(other):
             return False
 
@@ -273,7 +350,9 @@ class MatrixFactoryGate:
     @property
     def free_symbols(self) -> Iterable[sympy.Symbol]:
         """Unbound symbols in the gate matrix. See Gate.free_symbols for details."""
-        return _get_free_symbols(self.params)
+        return _cached_attr(
+            self, "_free_symbols", lambda: _get_free_symbols(self.params)
+        )
 
     __call__ = Gate.__call__
 
@@ -386,18 +465,21 @@ class CustomGateMatrixFactory:
         return self.gate_definition.params_ordering
 
     def __call__(self, *gate_params):
-        return self.matrix.subs(
-            {symbol: arg for symbol, arg in zip(self.params_ordering, gate_params)}
-        )
+        return _xreplace_symbols(self.matrix, zip(self.params_ordering, gate_params))
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if type(self) != type(other):
             return False
 
         if self.params_ordering != other.params_ordering:
             return False
 
-        if not _are_matrices_equal(self.matrix, other.matrix):
+        if not _are_gate_definition_matrices_equal(
+            self.gate_definition, other.gate_definition
+        ):
             return False
 
         return True
@@ -440,6 +522,9 @@ class CustomGateDefinition:
         )
 
     def __eq__(self, other):
+        if self is other:
+            return True
+
         if type(self) != type(other):
             return False
 
@@ -449,11 +534,39 @@ class CustomGateDefinition:
         if self.params_ordering != other.params_ordering:
             return False
 
-        if not _are_matrices_equal(self.matrix, other.matrix):
+        if not _are_gate_definition_matrices_equal(self, other):
             return False
 
         return True
 
+    @property
+    def _numeric_matrix(self) -> Optional[np.ndarray]:
+        """Complex numpy array equal to `matrix`, or None if `matrix` has free symbols.
+
+        Computed on first access and reused afterwards.
+        """
+        return _cached_attr(
+            self, "_numeric_matrix_value", lambda: _numeric_matrix_or_none(self.matrix)
+        )
+
+
+def _numeric_matrix_or_none(matrix: sympy.Matrix) -> Optional[np.ndarray]:
+    return None if matrix.free_symbols else np.array(matrix, dtype=complex)
+
+
+def _are_gate_definition_matrices_equal(
+    gate_def: CustomGateDefinition, another_gate_def: CustomGateDefinition
+) -> bool:
+    numeric_matrix = gate_def._numeric_matrix
+    another_numeric_matrix = another_gate_def._numeric_matrix
+    if numeric_matrix is not None and another_numeric_matrix is not None:
+        # Same tolerance as the elementwise comparison of sympy matrices.
+        return numeric_matrix.shape == another_numeric_matrix.shape and np.allclose(
+            numeric_matrix - another_numeric_matrix, 0
+        )
+
+    return _are_matrices_equal(gate_def.matrix, another_gate_def.matrix)
+
 
 def _are_matrix_elements_equal(element, another_element):
     """Determine if two elements from gates' matrices are equal.
@@ -467,15 +580,19 @@ def _are_matrix_elements_equal(element, another_element):
     difference = sympy.N(sympy.expand(element) - sympy.expand(another_element))
 
     try:
-        return np.allclose(
-            float(sympy.re(difference)) + 1j * float(sympy.im(difference)), 0
-        )
+        return np.allclose(complex(difference), 0)
     except TypeError:
         return False
 
 
 def _are_matrices_equal(matrix, another_matrix):
+    if matrix.shape != another_matrix.shape:
+        return False
+
+    # Structural equality is cheap and covers most cases, numerical comparison is
+    # needed only for elements that differ e.g. by float rounding or form.
     return all(
-        _are_matrix_elements_equal(element, another_element)
+        element == another_element
+        or _are_matrix_elements_equal(element, another_element)
         for element, another_element in zip(matrix, another_matrix)
     )
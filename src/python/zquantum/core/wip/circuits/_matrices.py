@@ -1,116 +1,191 @@
 """Definition of predefined gate matrices and related utility functions."""
-import numpy as np
+import cmath
+import math
+from functools import lru_cache, wraps
+from numbers import Real
+from types import SimpleNamespace
+
 import sympy
 
+_INV_SQRT2 = 1 / math.sqrt(2)
+_SYMPY_INV_SQRT2 = 1 / sympy.sqrt(2)
+
+# Functions and constants used for building matrices of parametric gates. For plain
+# numbers, computing entries with math/cmath is much cheaper than constructing (and
+# later evaluating) sympy expressions.
+_NUMERIC_FUNCTIONS = SimpleNamespace(
+    cos=math.cos, sin=math.sin, exp=cmath.exp, I=1j, inv_sqrt2=_INV_SQRT2
+)
+_SYMBOLIC_FUNCTIONS = SimpleNamespace(
+    cos=sympy.cos, sin=sympy.sin, exp=sympy.exp, I=sympy.I, inv_sqrt2=_SYMPY_INV_SQRT2
+)
+
+
+def _functions_for(angle):
+    is_numeric = isinstance(angle, Real) and not isinstance(angle, sympy.Basic)
+    return _NUMERIC_FUNCTIONS if is_numeric else _SYMBOLIC_FUNCTIONS
+
+
+def _cached_parametric_factory(factory):
+    """Cache matrices of parametric gates, keyed by the parameters' values and types.
+
+    The same angles tend to be evaluated over and over again, e.g. in consecutive
+    optimization steps. Types are part of the key because e.g. `2` and
+    `sympy.Integer(2)` are equal but produce different matrices. Unhashable parameters
+    bypass the cache.
+    """
+    cached_factory = lru_cache(maxsize=1024, typed=True)(factory)
+
+    @wraps(factory)
+    def _factory(*params):
+        try:
+            hash(params)
+        except TypeError:
+            return factory(*params)
+        return cached_factory(*params)
+
+    return _factory
+
+
 # --- non-parametric gates ---
 
+# Matrices of non-parametric gates are constant, so they are defined once as module
+# constants. Factories returning them are kept for use with `MatrixFactoryGate`.
+# The matrices are shared by all callers, hence they are immutable.
+
+
+X_MATRIX = sympy.ImmutableMatrix([[0, 1], [1, 0]])
+
 
 def x_matrix():
-    return sympy.Matrix([[0, 1], [1, 0]])
+    return X_MATRIX
+
+
+Y_MATRIX = sympy.ImmutableMatrix([[0, -1j], [1j, 0]])
 
 
 def y_matrix():
-    return sympy.Matrix([[0, -1j], [1j, 0]])
+    return Y_MATRIX
+
+
+Z_MATRIX = sympy.ImmutableMatrix([[1, 0], [0, -1]])
 
 
 def z_matrix():
-    return sympy.Matrix([[1, 0], [0, -1]])
+    return Z_MATRIX
+
+
+H_MATRIX = sympy.ImmutableMatrix(
+    [
+        [_INV_SQRT2, _INV_SQRT2],
+        [_INV_SQRT2, -_INV_SQRT2],
+    ]
+)
 
 
 def h_matrix():
-    return sympy.Matrix(
-        [
-            [(1 / np.sqrt(2)), (1 / np.sqrt(2))],
-            [(1 / np.sqrt(2)), (-1 / np.sqrt(2))],
-        ]
-    )
+    return H_MATRIX
+
+
+I_MATRIX = sympy.ImmutableMatrix([[1, 0], [0, 1]])
 
 
 def i_matrix():
-    return sympy.Matrix([[1, 0], [0, 1]])
+    return I_MATRIX
+
+
+S_MATRIX = sympy.ImmutableMatrix(
+    [
+        [1, 0],
+        [0, 1j],
+    ]
+)
 
 
 def s_matrix():
-    return sympy.Matrix(
-        [
-            [1, 0],
-            [0, 1j],
-        ]
-    )
+    return S_MATRIX
+
+
+T_MATRIX = sympy.ImmutableMatrix(
+    [
+        [1, 0],
+        # Exact value of exp(i pi / 4), so that it can be simplified symbolically.
+        [0, (1 + sympy.I) * _SYMPY_INV_SQRT2],
+    ]
+)
 
 
 def t_matrix():
-    return sympy.Matrix(
-        [
-            [1, 0],
-            [0, sympy.exp(1j * np.pi / 4)],
-        ]
-    )
+    return T_MATRIX
 
 
 # --- gates with a single param ---
 
 
+@_cached_parametric_factory
 def rx_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, sin = fn.cos(angle / 2), fn.sin(angle / 2)
+    return sympy.ImmutableMatrix(
         [
-            [sympy.cos(angle / 2), -1j * sympy.sin(angle / 2)],
-            [-1j * sympy.sin(angle / 2), sympy.cos(angle / 2)],
+            [cos, -1j * sin],
+            [-1j * sin, cos],
         ]
     )
 
 
+@_cached_parametric_factory
 def ry_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, sin = fn.cos(angle / 2), fn.sin(angle / 2)
+    return sympy.ImmutableMatrix(
         [
-            [
-                sympy.cos(angle / 2),
-                -1 * sympy.sin(angle / 2),
-            ],
-            [
-                sympy.sin(angle / 2),
-                sympy.cos(angle / 2),
-            ],
+            [cos, -1 * sin],
+            [sin, cos],
         ]
     )
 
 
+@_cached_parametric_factory
 def rz_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    return sympy.ImmutableMatrix(
         [
             [
-                sympy.exp(-1 * sympy.I * angle / 2),
+                fn.exp(-1 * fn.I * angle / 2),
                 0,
             ],
             [
                 0,
-                sympy.exp(sympy.I * angle / 2),
+                fn.exp(fn.I * angle / 2),
             ],
         ]
     )
 
 
+@_cached_parametric_factory
 def rh_matrix(angle):
-    phase_factor = sympy.cos(angle / 2) + 1j * sympy.sin(angle / 2)
-    return phase_factor * sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, sin = fn.cos(angle / 2), fn.sin(angle / 2)
+    # Global phase is folded into the entries, so no intermediate matrix is built.
+    phase_factor = cos + 1j * sin
+    scaled_sin = -1j * fn.inv_sqrt2 * sin
+    off_diagonal = phase_factor * scaled_sin
+    return sympy.ImmutableMatrix(
         [
-            [
-                sympy.cos(angle / 2) - 1j / sympy.sqrt(2) * sympy.sin(angle / 2),
-                -1j / sympy.sqrt(2) * sympy.sin(angle / 2),
-            ],
-            [
-                -1j / sympy.sqrt(2) * sympy.sin(angle / 2),
-                sympy.cos(angle / 2) + 1j / sympy.sqrt(2) * sympy.sin(angle / 2),
-            ]
+            [phase_factor * (cos + scaled_sin), off_diagonal],
+            [off_diagonal, phase_factor * (cos - scaled_sin)],
         ]
     )
 
 
+@_cached_parametric_factory
 def phase_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    return sympy.ImmutableMatrix(
         [
             [1, 0],
-            [0, sympy.exp(1j * angle)],
+            [0, fn.exp(fn.I * angle)],
         ]
     )
 
@@ -118,90 +193,121 @@ def phase_matrix(angle):
 # --- non-parametric two qubit gates ---
 
 
+CNOT_MATRIX = sympy.ImmutableMatrix(
+    [
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 0, 1],
+        [0, 0, 1, 0],
+    ]
+)
+
+
 def cnot_matrix():
-    return sympy.Matrix(
-        [
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 0, 1],
-            [0, 0, 1, 0],
-        ]
-    )
+    return CNOT_MATRIX
+
+
+CZ_MATRIX = sympy.ImmutableMatrix(
+    [
+        [1, 0, 0, 0],
+        [0, 1, 0, 0],
+        [0, 0, 1, 0],
+        [0, 0, 0, -1],
+    ]
+)
 
 
 def cz_matrix():
-    return sympy.Matrix(
-        [
-            [1, 0, 0, 0],
-            [0, 1, 0, 0],
-            [0, 0, 1, 0],
-            [0, 0, 0, -1],
-        ]
-    )
+    return CZ_MATRIX
+
+
+SWAP_MATRIX = sympy.ImmutableMatrix(
+    [[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]]
+)
 
 
 def swap_matrix():
-    return sympy.Matrix([[1, 0, 0, 0], [0, 0, 1, 0], [0, 1, 0, 0], [0, 0, 0, 1]])
+    return SWAP_MATRIX
+
+
+ISWAP_MATRIX = sympy.ImmutableMatrix(
+    [[1, 0, 0, 0], [0, 0, 1j, 0], [0, 1j, 0, 0], [0, 0, 0, 1]]
+)
 
 
 def iswap_matrix():
-    return sympy.Matrix([[1, 0, 0, 0], [0, 0, 1j, 0], [0, 1j, 0, 0], [0, 0, 0, 1]])
+    return ISWAP_MATRIX
 
 
 # --- parametric two qubit gates ---
 
 
+@_cached_parametric_factory
 def cphase_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    return sympy.ImmutableMatrix(
         [
             [1, 0, 0, 0],
             [0, 1, 0, 0],
             [0, 0, 1, 0],
-            [0, 0, 0, sympy.exp(1j * angle)],
+            [0, 0, 0, fn.exp(fn.I * angle)],
         ]
     )
 
 
+@_cached_parametric_factory
 def xx_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, minus_i_sin = fn.cos(angle / 2), -1j * fn.sin(angle / 2)
+    return sympy.ImmutableMatrix(
         [
-            [sympy.cos(angle / 2), 0, 0, -1j * sympy.sin(angle / 2)],
-            [0, sympy.cos(angle / 2), -1j * sympy.sin(angle / 2), 0],
-            [0, -1j * sympy.sin(angle / 2), sympy.cos(angle / 2), 0],
-            [-1j * sympy.sin(angle / 2), 0, 0, sympy.cos(angle / 2)],
+            [cos, 0, 0, minus_i_sin],
+            [0, cos, minus_i_sin, 0],
+            [0, minus_i_sin, cos, 0],
+            [minus_i_sin, 0, 0, cos],
         ]
     )
 
 
+@_cached_parametric_factory
 def yy_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, i_sin = fn.cos(angle / 2), 1j * fn.sin(angle / 2)
+    return sympy.ImmutableMatrix(
         [
-            [sympy.cos(angle / 2), 0, 0, 1j * sympy.sin(angle / 2)],
-            [0, sympy.cos(angle / 2), -1j * sympy.sin(angle / 2), 0],
-            [0, -1j * sympy.sin(angle / 2), sympy.cos(angle / 2), 0],
-            [1j * sympy.sin(angle / 2), 0, 0, sympy.cos(angle / 2)],
+            [cos, 0, 0, i_sin],
+            [0, cos, -i_sin, 0],
+            [0, -i_sin, cos, 0],
+            [i_sin, 0, 0, cos],
         ]
     )
 
 
+@_cached_parametric_factory
 def zz_matrix(angle):
-    arg = angle / 2
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    # cos(angle / 2) -/+ i sin(angle / 2), written as exponentials.
+    negative_phase = fn.exp(-1 * fn.I * angle / 2)
+    positive_phase = fn.exp(fn.I * angle / 2)
+    return sympy.ImmutableMatrix(
         [
-            [sympy.cos(arg) - 1j * sympy.sin(arg), 0, 0, 0],
-            [0, sympy.cos(arg) + 1j * sympy.sin(arg), 0, 0],
-            [0, 0, sympy.cos(arg) + 1j * sympy.sin(arg), 0],
-            [0, 0, 0, sympy.cos(arg) - 1j * sympy.sin(arg)],
+            [negative_phase, 0, 0, 0],
+            [0, positive_phase, 0, 0],
+            [0, 0, positive_phase, 0],
+            [0, 0, 0, negative_phase],
         ]
     )
 
 
+@_cached_parametric_factory
 def xy_matrix(angle):
-    return sympy.Matrix(
+    fn = _functions_for(angle)
+    cos, i_sin = fn.cos(angle / 2), 1j * fn.sin(angle / 2)
+    return sympy.ImmutableMatrix(
         [
             [1, 0, 0, 0],
-            [0, sympy.cos(angle / 2), 1j * sympy.sin(angle / 2), 0],
-            [0, 1j * sympy.sin(angle / 2), sympy.cos(angle / 2), 0],
+            [0, cos, i_sin, 0],
+            [0, i_sin, cos, 0],
             [0, 0, 0, 1],
         ]
     )
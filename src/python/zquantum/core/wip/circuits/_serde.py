@@ -17,30 +17,34 @@ def _make_symbols_map(symbol_names):
     return {name: sympy.Symbol(name) for name in symbol_names}
 
 
-def deserialize_expr(expr_str, symbol_names):
-    symbols_map = _make_symbols_map(symbol_names)
+def _deserialize_expr_with_symbols_map(expr_str, symbols_map):
     return sympy.sympify(expr_str, locals=symbols_map)
 
 
+def deserialize_expr(expr_str, symbol_names):
+    return _deserialize_expr_with_symbols_map(expr_str, _make_symbols_map(symbol_names))
+
+
 def builtin_gate_by_name(name):
     return _builtin_gates.builtin_gate_by_name(name)
 
 
 def _matrix_to_json(matrix: sympy.Matrix):
-    return [
-        [serialize_expr(element) for element in matrix.row(row_i)]
-        for row_i in range(matrix.shape[0])
-    ]
+    return [[serialize_expr(element) for element in row] for row in matrix.tolist()]
 
 
 def _matrix_from_json(
     json_rows: List[List[str]], symbols_names: Iterable[str]
 ) -> sympy.Matrix:
+    symbols_map = _make_symbols_map(symbols_names)
+    # Gate matrices tend to repeat entries (zeros especially), so each distinct
+    # string is parsed only once.
+    parsed_elements = {
+        element: _deserialize_expr_with_symbols_map(element, symbols_map)
+        for element in set(element for json_row in json_rows for element in json_row)
+    }
     return sympy.Matrix(
-        [
-            [deserialize_expr(element, symbols_names) for element in json_row]
-            for json_row in json_rows
-        ]
+        [[parsed_elements[element] for element in json_row] for json_row in json_rows]
     )
 
 
@@ -187,9 +191,10 @@ def _builtin_gate_from_dict(dict_) -> _builtin_gates.GateRef:
         raise KeyError()
 
     if _gates.gate_is_parametric(gate_ref, dict_.get("params")):
+        symbols_map = _make_symbols_map(dict_.get("free_symbols", []))
         return gate_ref(
             *[
-                deserialize_expr(param, dict_.get("free_symbols", []))
+                _deserialize_expr_with_symbols_map(param, symbols_map)
                 for param in dict_["params"]
             ]
         )
@@ -233,7 +238,10 @@ def _custom_gate_instance_from_dict(dict_, custom_gate_defs) -> _gates.Gate:
             f"Custom gate definition for {dict_['name']} missing from serialized dict"
         )
 
-    symbol_names = map(serialize_expr, gate_def.params_ordering)
+    symbols_map = _make_symbols_map(map(serialize_expr, gate_def.params_ordering))
     return gate_def(
-        *[deserialize_expr(param, symbol_names) for param in dict_["params"]]
+        *[
+            _deserialize_expr_with_symbols_map(param, symbols_map)
+            for param in dict_["params"]
+        ]
     )
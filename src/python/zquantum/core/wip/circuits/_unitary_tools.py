@@ -24,45 +24,34 @@ def _basis_bitstring(i, num_qubits):
     return [int(char) for char in bin(i)[2:].zfill(num_qubits)]
 
 
-def _bitstring_to_sympy_dense_vector(state):
-    """Construct sympy matrix representation of a state given by a bitstring."""
-    basis = [sympy.Matrix([1, 0]), sympy.Matrix([0, 1])]
-    return sympy.kronecker_product(*[basis[bit] for bit in state])
+def _bitstring_to_index(bitstring):
+    """Index of the basis vector corresponding to given bitstring."""
+    return int("".join(map(str, bitstring)), 2) if bitstring else 0
 
 
-def _bitstring_to_numpy_dense_vector(state):
-    """Construct numpy array representation of a state given by a bitstring."""
-    basis = [np.array([1, 0]), np.array([0, 1])]
-    return reduce(np.kron, (basis[bit] for bit in state))
-
-
-def _permutation_matrix(target_indices_order, zeros, bitstring_to_dense_vector):
-    """Construct a permutation matrix for N qubit system.
+def _permutation_indices(target_indices_order):
+    """Construct a permutation of basis states of N qubit system.
 
     Args:
         target_indices_order: the desired order of systems (qubits) after permutation.
            This should contain all entries from 0 to N-1, where N is the number of
            qubits.
-        zeros: function for constructing all-zero matrix that will be filled with
-            appropriate entries.
-        bitstring_to_dense_vector: function constructing dense vector from bitstring.
     Returns:
-        Matrix permuting qubits according to given ordering.
-    Notes:
-        Matrix acts on whole N-qubit system, regardless of how many qubits actually
-        change their position. The `zeros` and `bitstring_to_dense_vector` functions are
-        used for constructing variants of this function depending on whether sympy or
-        numpy should be used (see below how this dispatching is done).
+        List `indices` such that the i-th basis state is mapped to the `indices[i]`-th
+        one. This is a sparse representation of the permutation matrix P, whose i-th
+        column is the `indices[i]`-th basis vector. In particular, P^T @ A @ P is equal
+        to A with rows and columns reordered according to `indices`, which is cheaper
+        to compute than both of the matrix products.
     """
     num_qubits = len(target_indices_order)
     if sorted(target_indices_order) != list(range(num_qubits)):
         raise ValueError("Not all qubits given in permutation.")
-    perm_matrix = zeros((2 ** num_qubits, 2 ** num_qubits))
-    for i in range(2 ** num_qubits):
-        input_state = _basis_bitstring(i, num_qubits)
-        output_state = _permute(input_state, target_indices_order)
-        perm_matrix[:, i] = bitstring_to_dense_vector(output_state)
-    return perm_matrix
+    return [
+        _bitstring_to_index(
+            _permute(_basis_bitstring(i, num_qubits), target_indices_order)
+        )
+        for i in range(2 ** num_qubits)
+    ]
 
 
 def _permutation_making_qubits_adjacent(qubit_indices, num_qubits):
@@ -73,14 +62,22 @@ def _permutation_making_qubits_adjacent(qubit_indices, num_qubits):
     ]
 
 
+def _validate_qubit_indices(qubit_indices, num_qubits):
+    """Check that all `qubit_indices` refer to qubits of N-qubit system."""
+    if any(not 0 <= index < num_qubits for index in qubit_indices):
+        raise ValueError(
+            f"Matrix acting on qubits {tuple(qubit_indices)} cannot be lifted to "
+            f"{num_qubits}-qubit system."
+        )
+
+
 def _lift_matrix(
     matrix,
     qubit_indices,
     num_qubits,
-    zeros,
     eye,
     kronecker_product,
-    bitstring_to_dense_vector,
+    permute_basis,
 ):
     """Lift a matrix acting on subsystem of N-qubit system to one acting on the whole
     system.
@@ -88,27 +85,25 @@ def _lift_matrix(
     Args:
         matrix: matrix acting on k `qubits`
         qubit_indices: indices of qubits that matrix acts on
-        zeros: function constructing all-zero matrix. It is assumed that it can be
-            called like `zeros((m, n))`.
         eye: function constructing identity matrix
         kronecker_product: function computing kronecker product of matrices.
             It is assumed that it can be applied like `kronecker_product(x, y)`.
-        bitstring_to_dense_vector: function converting bitstring to dense vector.
+        permute_basis: function reordering rows and columns of a matrix. It is
+            assumed that it can be applied like `permute_basis(x, indices)`, where
+            `indices` is as returned by `_permutation_indices`.
     Returns:
         Matrix that acts like `matrix` on qubits with indices `qubit_indices` and as
             identity on other qubits.
+    Raises:
+        ValueError: if any of `qubit_indices` is out of range for `num_qubits` qubits.
     """
+    _validate_qubit_indices(qubit_indices, num_qubits)
     smallest, largest = min(qubit_indices), max(qubit_indices)
     # No need to consider all the qubits, just those between smallest and largest one
     shifted_qubits = [index - smallest for index in qubit_indices]
     inner_permutation = _permutation_making_qubits_adjacent(
         shifted_qubits, largest - smallest + 1
     )
-    # perm_matrix permutes qubits in range smallest-largest so that the active
-    # ones come first.
-    perm_matrix = _permutation_matrix(
-        inner_permutation, zeros, bitstring_to_dense_vector
-    )
 
     # inner_gate_matrix acts on the whole range smallest-largest, by
     # transforming first qubits in the same way as matrix, and leaving
@@ -116,34 +111,73 @@ def _lift_matrix(
     inner_gate_matrix = kronecker_product(
         matrix, eye(2 ** (largest - smallest - len(qubit_indices) + 1))
     )
-    # target operation acting on smallest-largest range is now composed of
-    # 1. basis change (via permutation)
-    # 2. gate action
-    # 3. reversal of basis change
-    inner_matrix = perm_matrix.transpose() @ inner_gate_matrix @ perm_matrix
+
+    if inner_permutation == list(range(len(inner_permutation))):
+        # Active qubits are already adjacent and in order, hence no basis change
+        # is needed.
+        inner_matrix = inner_gate_matrix
+    else:
+        # target operation acting on smallest-largest range is now composed of
+        # 1. basis change (via permutation making active qubits come first)
+        # 2. gate action
+        # 3. reversal of basis change
+        # The basis changes amount to reordering rows and columns of the gate
+        # action, so no permutation matrices are constructed.
+        inner_matrix = permute_basis(
+            inner_gate_matrix, _permutation_indices(inner_permutation)
+        )
+
     # finally, to make a matrix acting on whole range of qubits, we
     # add identities acting on qubits with indices outside of smallest-largest range.
+    # Identities acting on no qubits at all would be no-ops, so they are skipped.
+    num_qubits_after = num_qubits - largest - 1
     return reduce(
         kronecker_product,
-        [eye(2 ** smallest), inner_matrix, eye(2 ** (num_qubits - largest - 1))],
+        ([eye(2 ** smallest)] if smallest > 0 else [])
+        + [inner_matrix]
+        + ([eye(2 ** num_qubits_after)] if num_qubits_after > 0 else []),
     )
 
 
+def _lift_diagonal_numpy(diagonal, qubit_indices, num_qubits):
+    """Lift a diagonal of matrix acting on subsystem of N-qubit system to a diagonal of
+    matrix acting on the whole system.
+
+    The lifted matrix is diagonal too, and its entry corresponding to a basis state
+    is the entry of `diagonal` corresponding to this state restricted to
+    `qubit_indices`. Hence, the lifted diagonal can be computed just by indexing,
+    without any kronecker products or permutations.
+    """
+    basis_indices = np.arange(2 ** num_qubits)
+    subsystem_indices = np.zeros(2 ** num_qubits, dtype=int)
+    for qubit in qubit_indices:
+        # Qubit 0 corresponds to the most significant bit of basis state index.
+        qubit_bits = (basis_indices >> (num_qubits - qubit - 1)) & 1
+        subsystem_indices = 2 * subsystem_indices + qubit_bits
+    return diagonal[subsystem_indices]
+
+
 def _lift_matrix_numpy(matrix, qubits, num_qubits):
     """A version of _lift_matrix working on numpy arrays.
 
-    Notice that the input matrix is typically sympy's matrix, so we have to first
-    convert it.
+    The input matrix can be either a sympy matrix, which is converted first, or
+    a complex numpy array, which is used as is.
+
+    Diagonal matrices (e.g. of RZ, PHASE, CZ, CPHASE or ZZ gates) are lifted
+    directly, see `_lift_diagonal_numpy`.
     """
-    matrix = np.array(matrix, dtype=complex)
+    matrix = np.asarray(matrix, dtype=complex)
+    diagonal = np.diagonal(matrix)
+    if np.array_equal(matrix, np.diag(diagonal)):
+        _validate_qubit_indices(qubits, num_qubits)
+        return np.diag(_lift_diagonal_numpy(diagonal, qubits, num_qubits))
     return _lift_matrix(
         matrix,
         qubits,
         num_qubits,
-        np.zeros,
         np.eye,
         np.kron,
-        _bitstring_to_numpy_dense_vector,
+        lambda matrix, indices: matrix[np.ix_(indices, indices)],
     )
 
 
@@ -153,9 +187,39 @@ def _lift_matrix_sympy(matrix, qubits, num_qubits):
         matrix,
         qubits,
         num_qubits,
-        # sympy has different signature of `zeros` than numpy, hence the below adapter.
-        lambda size: sympy.zeros(*size),
         sympy.eye,
         sympy.kronecker_product,
-        _bitstring_to_sympy_dense_vector,
+        lambda matrix, indices: matrix.extract(indices, indices),
+    )
+
+
+def _apply_matrix_numpy(matrix, qubit_indices, wavefunction):
+    """Apply matrix acting on subsystem of N-qubit system to N-qubit wavefunction.
+
+    The result is the same as multiplying wavefunction by the lifted matrix, but the
+    lifted matrix is never constructed. Instead, the wavefunction is viewed as
+    a tensor with one axis per qubit, and the matrix is contracted with the axes
+    corresponding to `qubit_indices`. This takes O(2^N) memory instead of O(4^N).
+
+    Args:
+        matrix: matrix acting on k qubits, either a sympy matrix without free symbols
+            or a numpy array.
+        qubit_indices: indices of qubits that matrix acts on.
+        wavefunction: 1-D array of length 2^N.
+    Returns:
+        Numpy array with the transformed wavefunction.
+    """
+    num_qubits = len(wavefunction).bit_length() - 1
+    num_active_qubits = len(qubit_indices)
+    # Qubit 0 corresponds to the most significant bit of basis state index, and
+    # hence to the first axis of the reshaped arrays.
+    state = np.asarray(wavefunction, dtype=complex).reshape((2,) * num_qubits)
+    gate = np.asarray(matrix, dtype=complex).reshape((2,) * (2 * num_active_qubits))
+    result = np.tensordot(
+        gate,
+        state,
+        axes=(list(range(num_active_qubits, 2 * num_active_qubits)), qubit_indices),
     )
+    # tensordot places output axes of the gate first, so they need to be moved back to
+    # positions of the qubits they correspond to.
+    return np.moveaxis(result, range(num_active_qubits), qubit_indices).reshape(-1)
@@ -1,7 +1,7 @@
 """Utilities for converting symbolic expressions between different dialects."""
 
 from numbers import Number
-from typing import NamedTuple, Any, Iterable, Dict, Callable
+from typing import NamedTuple, Any, Dict, Callable, Tuple
 from functools import reduce
 
 
@@ -15,7 +15,7 @@ class FunctionCall(NamedTuple):
     """Represents abstract function call.     """
 
     name: str
-    args: Iterable["Expression"]
+    args: Tuple["Expression", ...]
 
 
 # Note that mypy does not support recursive types, so for now Expression is set
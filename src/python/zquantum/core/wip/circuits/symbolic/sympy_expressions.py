@@ -1,6 +1,6 @@
 """Utilities for converting sympy expressions to our native Expression format."""
 import operator
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from numbers import Number
 
 import sympy
@@ -20,40 +20,54 @@ def is_addition_of_negation(sympy_add: sympy.Add) -> bool:
     return len(args) == 2 and isinstance(args[1], sympy.Mul) and args[1].args[0] == -1
 
 
-@singledispatch
 def expression_from_sympy(expression):
     """Parse Sympy expression into intermediate expression tree."""
+    if isinstance(expression, sympy.Basic):
+        return _cached_expression_from_sympy(expression)
+    return _expression_from_sympy(expression)
+
+
+# Sympy expressions are immutable and hashable, and the same subexpressions (e.g.
+# cos(theta / 2)) recur across gate parameters and matrix elements, so their
+# translations are memoized. `typed=True` keeps e.g. Integer(2) and Float(2.0) apart.
+@lru_cache(maxsize=4096, typed=True)
+def _cached_expression_from_sympy(expression: sympy.Basic):
+    return _expression_from_sympy(expression)
+
+
+@singledispatch
+def _expression_from_sympy(expression):
     raise NotImplementedError(
         f"Expression {expression} of type {type(expression)} is currently not supported"
     )
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def identity(number: Number):
     return number
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def symbol_from_sympy(symbol: sympy.Symbol):
     return Symbol(str(symbol))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_integer_from_sympy_integer(number: sympy.Integer):
     return int(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_float_from_sympy_float(number: sympy.Float):
     return float(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_float_from_sympy_rational(number: sympy.Rational):
     return float(number)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def native_imaginary_unit_from_sympy_imaginary_unit(
     _unit: sympy.core.numbers.ImaginaryUnit,
 ):
@@ -64,7 +78,7 @@ def _negate_sympy_expr(expr):
     return expr * (-1)
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def addition_from_sympy_add(add: sympy.Add):
     if is_addition_of_negation(add):
         return FunctionCall(
@@ -77,7 +91,7 @@ def addition_from_sympy_add(add: sympy.Add):
     return FunctionCall("add", expression_from_sympy(add.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def multiplication_from_sympy_mul(mul: sympy.Mul):
     if is_multiplication_by_reciprocal(mul):
         return FunctionCall(
@@ -91,7 +105,7 @@ def multiplication_from_sympy_mul(mul: sympy.Mul):
         return FunctionCall("mul", expression_from_sympy(mul.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def power_from_sympy_pow(power: sympy.Pow):
     if power.args[1] == -1:
         return FunctionCall("div", (1, expression_from_sympy(power.args[0])))
@@ -101,12 +115,12 @@ def power_from_sympy_pow(power: sympy.Pow):
         return FunctionCall("pow", expression_from_sympy(power.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def function_call_from_sympy_function(function: sympy.Function):
     return FunctionCall(str(function.func), expression_from_sympy(function.args))
 
 
-@expression_from_sympy.register
+@_expression_from_sympy.register
 def expression_tuple_from_tuple_of_sympy_args(args: tuple):
     return tuple(expression_from_sympy(arg) for arg in args)
 
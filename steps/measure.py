@@ -37,10 +37,8 @@ from zquantum.core.utils import (
 )
 
 
-def run_circuit_and_measure(
+def _create_backend(
     backend_specs: Specs,
-    circuit: Union[str, Dict],
-    n_samples: Optional[int] = None,
     noise_model: Optional[str] = None,
     device_connectivity: Optional[str] = None,
 ):
@@ -53,7 +51,17 @@ def run_circuit_and_measure(
             device_connectivity
         )
 
-    backend = create_object(backend_specs)
+    return create_object(backend_specs)
+
+
+def run_circuit_and_measure(
+    backend_specs: Specs,
+    circuit: Union[str, Dict],
+    n_samples: Optional[int] = None,
+    noise_model: Optional[str] = None,
+    device_connectivity: Optional[str] = None,
+):
+    backend = _create_backend(backend_specs, noise_model, device_connectivity)
     if isinstance(circuit, str):
         circuit = load_circuit(circuit)
     else:
@@ -70,18 +78,8 @@ def run_circuitset_and_measure(
     noise_model: Optional[str] = None,
     device_connectivity: Optional[str] = None,
 ):
-
-    if isinstance(backend_specs, str):
-        backend_specs = json.loads(backend_specs)
-    if noise_model is not None:
-        backend_specs["noise_model"] = load_noise_model(noise_model)
-    if device_connectivity is not None:
-        backend_specs["device_connectivity"] = load_circuit_connectivity(
-            device_connectivity
-        )
-
+    backend = _create_backend(backend_specs, noise_model, device_connectivity)
     circuit_set = load_circuit_set(circuitset)
-    backend = create_object(backend_specs)
 
     measurements_set = backend.run_circuitset_and_measure(
         circuit_set, n_samples=n_samples
@@ -96,16 +94,7 @@ def get_bitstring_distribution(
     noise_model: Optional[str] = None,
     device_connectivity: Optional[str] = None,
 ):
-    if isinstance(backend_specs, str):
-        backend_specs = json.loads(backend_specs)
-    if noise_model is not None:
-        backend_specs["noise_model"] = load_noise_model(noise_model)
-    if device_connectivity is not None:
-        backend_specs["device_connectivity"] = load_circuit_connectivity(
-            device_connectivity
-        )
-
-    backend = create_object(backend_specs)
+    backend = _create_backend(backend_specs, noise_model, device_connectivity)
     circuit = load_circuit(circuit)
 
     bitstring_distribution = backend.get_bitstring_distribution(circuit)
@@ -132,16 +121,7 @@ def evaluate_ansatz_based_cost_function(
     else:
         ansatz = create_object(ansatz_specs)
 
-    if isinstance(backend_specs, str):
-        backend_specs = json.loads(backend_specs)
-    if noise_model is not None:
-        backend_specs["noise_model"] = load_noise_model(noise_model)
-    if device_connectivity is not None:
-        backend_specs["device_connectivity"] = load_circuit_connectivity(
-            device_connectivity
-        )
-
-    backend = create_object(backend_specs)
+    backend = _create_backend(backend_specs, noise_model, device_connectivity)
 
     if isinstance(cost_function_specs, str):
         cost_function_specs = json.loads(cost_function_specs)
@@ -17,24 +17,37 @@ from zquantum.core.graph import (
 
 
 class TestGraph(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Fixture graphs shared by tests. Tests mutating them should use copies.
+        cls.triangle = nx.Graph()
+        cls.triangle.add_edges_from([(1, 2), (2, 3), (1, 3)])
+
+        cls.complete_graph_on_three_nodes = nx.Graph()
+        cls.complete_graph_on_three_nodes.add_edges_from([(0, 1), (1, 2), (0, 2)])
+
     def test_compare_graphs(self):
         # Given
-        G1 = nx.Graph()
-        G2 = nx.Graph()
+        G1 = self.triangle
+        G2 = self.triangle.copy()
         G3 = nx.Graph()
 
-        G1.add_edges_from([(1, 2), (2, 3), (1, 3)])
-        G2.add_edges_from([(1, 2), (2, 3), (1, 3)])
         G3.add_edges_from([(1, 2), (2, 3)])
 
         # When/Then
         self.assertTrue(compare_graphs(G1, G2))
         self.assertFalse(compare_graphs(G2, G3))
 
+        # Given
+        G4 = G1.copy()
+        G4.add_node(4)
+
+        # When/Then
+        self.assertFalse(compare_graphs(G1, G4))
+
     def test_graph_io(self):
         # Given
-        G = nx.Graph()
-        G.add_edges_from([(1, 2), (2, 3), (1, 3)])
+        G = self.triangle
 
         # When
         save_graph(G, "Graph.json")
@@ -47,8 +60,7 @@ class TestGraph(unittest.TestCase):
 
     def test_generate_graph_node_dict(self):
         # Given
-        G = nx.Graph()
-        G.add_edges_from([(1, 2), (2, 3), (1, 3)])
+        G = self.triangle
         target_node_dict = {1: 0, 2: 1, 3: 2}
 
         # When
@@ -61,8 +73,7 @@ class TestGraph(unittest.TestCase):
         # Given
         num_nodes = 3
         probability = 1
-        target_graph = nx.Graph()
-        target_graph.add_edges_from([(0, 1), (1, 2), (0, 2)])
+        target_graph = self.complete_graph_on_three_nodes
 
         # When
         graph = generate_random_graph_erdos_renyi(num_nodes, probability)
@@ -74,6 +85,7 @@ class TestGraph(unittest.TestCase):
         num_nodes = 3
         probability = 0
         target_graph = nx.Graph()
+        target_graph.add_nodes_from(range(num_nodes))
 
         # When
         graph = generate_random_graph_erdos_renyi(num_nodes, probability)
@@ -101,8 +113,7 @@ class TestGraph(unittest.TestCase):
 
         # Then
         for n in graph.nodes():
-            node_in_edge = [n in e for e in graph.edges()]
-            self.assertTrue(sum(node_in_edge) == degree)
+            self.assertEqual(graph.degree(n), degree)
 
         # Given
         num_nodes = 20
@@ -186,8 +197,7 @@ class TestGraph(unittest.TestCase):
     def test_generate_graph_from_specs(self):
         # Given
         specs = {"type_graph": "erdos_renyi", "num_nodes": 3, "probability": 1.0}
-        target_graph = nx.Graph()
-        target_graph.add_edges_from([(0, 1), (1, 2), (0, 2)])
+        target_graph = self.complete_graph_on_three_nodes
 
         # When
         graph = generate_graph_from_specs(specs)
@@ -203,8 +213,7 @@ class TestGraph(unittest.TestCase):
 
         # Then
         for n in graph.nodes():
-            node_in_edge = [n in e for e in graph.edges()]
-            self.assertTrue(sum(node_in_edge) == 2)
+            self.assertEqual(graph.degree(n), 2)
 
         # Given
         specs = {"type_graph": "complete", "num_nodes": 4}
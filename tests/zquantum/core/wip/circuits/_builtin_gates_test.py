@@ -1,5 +1,7 @@
 """Test cases for _builtin_gates_module."""
+import numpy as np
 import pytest
+import sympy
 from zquantum.core.wip.circuits import _builtin_gates
 
 
@@ -30,3 +32,42 @@ class TestBuiltinGatesProperties:
     )
     def test_gates_matrix_equals_its_adjoint_iff_gate_is_hermitian(self, gate):
         assert (gate.matrix == gate.matrix.adjoint()) == gate.is_hermitian
+
+    @pytest.mark.parametrize(
+        "gate_prototype",
+        [
+            _builtin_gates.RX,
+            _builtin_gates.RY,
+            _builtin_gates.RZ,
+            _builtin_gates.RH,
+            _builtin_gates.PHASE,
+            _builtin_gates.CPHASE,
+            _builtin_gates.XX,
+            _builtin_gates.YY,
+            _builtin_gates.ZZ,
+            _builtin_gates.XY,
+        ],
+    )
+    @pytest.mark.parametrize("angle", [0, 0.5, -np.pi / 3])
+    def test_numeric_and_symbolic_matrices_of_parametric_gates_agree(
+        self, gate_prototype, angle
+    ):
+        theta = sympy.Symbol("theta")
+        numeric_matrix = np.array(gate_prototype(angle).matrix, dtype=complex)
+        symbolic_matrix = gate_prototype(theta).matrix.subs(theta, angle).evalf()
+
+        np.testing.assert_allclose(
+            numeric_matrix, np.array(symbolic_matrix, dtype=complex), atol=1e-12
+        )
+
+    @pytest.mark.parametrize("angle", [0.1, np.pi / 5, 2.5, sympy.Symbol("theta")])
+    def test_zz_matrix_is_diagonal_with_cos_and_sin_of_half_angle(self, angle):
+        cos, sin = sympy.cos(angle / 2), sympy.sin(angle / 2)
+        expected_matrix = sympy.diag(
+            cos - 1j * sin, cos + 1j * sin, cos + 1j * sin, cos - 1j * sin
+        )
+        difference = (_builtin_gates.ZZ(angle).matrix - expected_matrix).rewrite(
+            sympy.exp
+        )
+
+        assert sympy.simplify(difference).evalf().norm() < 1e-12
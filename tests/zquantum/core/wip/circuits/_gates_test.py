@@ -1,10 +1,15 @@
 """Test cases for _gates module."""
 from unittest.mock import Mock
 
+import numpy as np
 import pytest
 import sympy
 from zquantum.core.wip.circuits import _builtin_gates
-from zquantum.core.wip.circuits._gates import GateOperation, MatrixFactoryGate
+from zquantum.core.wip.circuits._gates import (
+    CustomGateDefinition,
+    GateOperation,
+    MatrixFactoryGate,
+)
 
 GATES_REPRESENTATIVES = [
     _builtin_gates.X,
@@ -56,6 +61,24 @@ class TestMatrixFactoryGate:
         assert gate.matrix == factory(*params)
         wrapped_factory.assert_called_once_with(*params)
 
+    def test_constructs_its_matrix_only_once_when_accessed_multiple_times(self):
+        wrapped_factory = Mock(wraps=example_one_qubit_matrix_factory)
+        gate = MatrixFactoryGate("U", wrapped_factory, (0.5, sympy.Symbol("x")), 1)
+
+        assert gate.matrix == gate.matrix
+        wrapped_factory.assert_called_once_with(0.5, sympy.Symbol("x"))
+
+    def test_matrix_cannot_be_changed_by_mutating_returned_matrix(self):
+        gate = MatrixFactoryGate("U", example_one_qubit_matrix_factory, (0.5, 2), 1)
+
+        with pytest.raises(TypeError):
+            gate.matrix[0, 0] = 5
+
+        mutable_matrix = gate.matrix.as_mutable()
+        mutable_matrix[0, 0] = 5
+
+        assert gate.matrix == example_one_qubit_matrix_factory(0.5, 2)
+
     def test_binding_parameters_creates_new_instance_with_substituted_free_params(self):
         gamma, theta, x, y = sympy.symbols("gamma, theta, x, y")
         params = (theta, x + y)
@@ -203,6 +226,62 @@ class TestControlledGate:
         ).controlled(2)
 
 
+class TestCustomGateDefinition:
+    def test_definitions_with_numerically_equal_matrices_are_equal(self):
+        theta = sympy.Symbol("theta")
+        gate_def = CustomGateDefinition(
+            "U", sympy.Matrix([[sympy.cos(theta), 0], [0, 0.5]]), (theta,)
+        )
+        another_gate_def = CustomGateDefinition(
+            "U",
+            sympy.Matrix([[sympy.cos(theta), 0], [0, sympy.Rational(1, 2)]]),
+            (theta,),
+        )
+
+        assert gate_def == another_gate_def
+
+    def test_definitions_with_numeric_matrices_are_compared_up_to_tolerance(self):
+        gate_def = CustomGateDefinition(
+            "U", sympy.Matrix([[1, 0], [0, 1 / sympy.sqrt(2)]]), ()
+        )
+        close_gate_def = CustomGateDefinition(
+            "U", sympy.Matrix([[1, 0], [0, 0.7071067811865476]]), ()
+        )
+        different_gate_def = CustomGateDefinition(
+            "U", sympy.Matrix([[1, 0], [0, 0.7]]), ()
+        )
+
+        assert gate_def == close_gate_def
+        assert gate_def != different_gate_def
+
+    def test_matrix_of_custom_gate_cannot_be_changed_by_mutating_returned_matrix(
+        self,
+    ):
+        theta = sympy.Symbol("theta")
+        gate = CustomGateDefinition(
+            "U", sympy.Matrix([[sympy.cos(theta), 0], [0, 1]]), (theta,)
+        )(0.5)
+        expected_matrix = sympy.Matrix([[sympy.cos(0.5), 0], [0, 1]])
+
+        with pytest.raises(TypeError):
+            gate.matrix[0, 0] = 5
+
+        mutable_matrix = gate.matrix.as_mutable()
+        mutable_matrix[0, 0] = 5
+
+        assert gate.matrix == expected_matrix
+        np.testing.assert_allclose(
+            GateOperation(gate, (0,)).lifted_matrix(1),
+            np.array(expected_matrix, dtype=complex),
+        )
+
+    def test_definitions_with_matrices_of_different_shapes_are_not_equal(self):
+        gate_def = CustomGateDefinition("U", sympy.Matrix([[1, 0], [0, 1]]), ())
+        another_gate_def = CustomGateDefinition("U", sympy.eye(4), ())
+
+        assert gate_def != another_gate_def
+
+
 @pytest.mark.parametrize("gate", GATES_REPRESENTATIVES)
 class TestGateOperation:
     def test_bound_symbols_are_not_present_in_gate_parameters(self, gate):
@@ -221,3 +300,74 @@ class TestGateOperation:
         new_params = tuple(-1 * param for param in op.params)
 
         assert op.replace_params(new_params).params == new_params
+
+    def test_lifted_matrix_of_numeric_gate_on_its_own_qubits_equals_its_matrix(
+        self, gate
+    ):
+        if gate.free_symbols:
+            pytest.skip("Lifted matrices of symbolic gates are not numeric.")
+
+        op = GateOperation(gate, tuple(range(gate.num_qubits)))
+        expected_matrix = np.array(gate.matrix, dtype=complex)
+
+        np.testing.assert_allclose(op.lifted_matrix(gate.num_qubits), expected_matrix)
+        # Lifting again must not be affected by reusing the converted matrix.
+        np.testing.assert_allclose(op.lifted_matrix(gate.num_qubits), expected_matrix)
+
+    @pytest.mark.parametrize("first_qubit", [-1, 1])
+    def test_lifting_matrix_to_system_without_its_qubits_raises_error(
+        self, gate, first_qubit
+    ):
+        op = GateOperation(
+            gate, tuple(range(first_qubit, first_qubit + gate.num_qubits))
+        )
+
+        with pytest.raises(ValueError):
+            op.lifted_matrix(gate.num_qubits)
+
+
+class TestApplyingGateOperationToWavefunction:
+    @pytest.mark.parametrize(
+        "gate", [gate for gate in GATES_REPRESENTATIVES if not gate.free_symbols]
+    )
+    @pytest.mark.parametrize("num_qubits", [2, 4])
+    def test_gives_the_same_result_as_multiplying_by_lifted_matrix(
+        self, gate, num_qubits
+    ):
+        wavefunction = np.random.default_rng(42).normal(size=2 ** num_qubits) + 0j
+        wavefunction /= np.linalg.norm(wavefunction)
+        # Reversed order of qubits checks that the gate's qubits are not assumed to be
+        # sorted.
+        op = GateOperation(gate, tuple(reversed(range(gate.num_qubits))))
+
+        np.testing.assert_allclose(
+            op.apply(wavefunction), op.lifted_matrix(num_qubits) @ wavefunction
+        )
+
+    def test_gives_the_same_result_as_multiplying_by_lifted_matrix_for_controlled_gate(
+        self,
+    ):
+        wavefunction = np.random.default_rng(42).normal(size=2 ** 5) + 0j
+        op = _builtin_gates.XX(0.3).controlled(1)(4, 0, 2)
+
+        np.testing.assert_allclose(
+            op.apply(wavefunction), op.lifted_matrix(5) @ wavefunction
+        )
+
+    def test_cannot_be_applied_to_wavefunction_with_too_few_qubits(self):
+        with pytest.raises(ValueError):
+            _builtin_gates.CNOT(0, 2).apply(np.array([1, 0, 0, 0]))
+
+    def test_cannot_be_applied_to_qubits_with_negative_indices(self):
+        with pytest.raises(ValueError):
+            _builtin_gates.X(-1).apply(np.array([1, 0, 0, 0]))
+
+    def test_cannot_be_applied_to_repeated_qubits(self):
+        with pytest.raises(ValueError):
+            _builtin_gates.CNOT(0, 0).apply(np.array([1, 0, 0, 0]))
+
+    def test_cannot_be_applied_if_gate_has_free_symbols(self):
+        op = _builtin_gates.RX(sympy.Symbol("theta"))(0)
+
+        with pytest.raises(RuntimeError):
+            op.apply(np.array([1, 0]))
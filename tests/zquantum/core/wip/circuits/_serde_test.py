@@ -54,6 +54,11 @@ CUSTOM_U_GATE = _gates.CustomGateDefinition(
                 CUSTOM_U_GATE(ALPHA, -1)(2),
             ],
         ),
+        _circuit.Circuit(
+            operations=[
+                CUSTOM_U_GATE(THETA, GAMMA)(0),
+            ],
+        ),
         _circuit.Circuit(
             operations=[
                 CUSTOM_U_GATE(2 + 3j, -1)(2),
@@ -3,12 +3,16 @@ import numpy as np
 import pytest
 import sympy
 from zquantum.core.wip.circuits import (
+    CPHASE,
+    CZ,
+    PHASE,
     RX,
     RY,
     RZ,
     XX,
     XY,
     YY,
+    ZZ,
     Circuit,
     H,
     I,
@@ -35,6 +39,8 @@ class TestCreatingUnitaryFromCircuit:
                 ]
             ),
             Circuit([H(1), YY(0.1).controlled(1)(0, 1, 2), X(2), Y(3), Z(4)]),
+            Circuit([XY(0.4)(1, 2), RZ(0.2)(3), XX(0.1)(0, 1), YY(0.3)(2, 3)]),
+            Circuit([H(0), CZ(3, 1), PHASE(0.2)(2), ZZ(0.3)(4, 0), CPHASE(0.5)(1, 4)]),
         ],
     )
     def test_without_free_params_gives_the_same_result_as_cirq(self, circuit):